@@ -1,5 +1,20 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 """Entrypoint for the enterprise gateway package."""
-from .enterprisegatewayapp import launch_instance
+import sys
+
 from ._version import __version__
+
+
+def __getattr__(name):
+    # Defer loading the app module (PEP 562) so importing this package for
+    # __version__ doesn't pay for the application's import graph; the console
+    # entry point still resolves launch_instance on demand.
+    if name == 'launch_instance':
+        from .enterprisegatewayapp import launch_instance
+        return launch_instance
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # no module-level __getattr__ (PEP 562) before 3.7
+    from .enterprisegatewayapp import launch_instance
@@ -2,26 +2,174 @@
 # Distributed under the terms of the Modified BSD License.
 """Enterprise Gateway Jupyter application."""
 
+import importlib.util
 import os
 import signal
+import sys
 import getpass
 
-# Install the pyzmq ioloop. This has to be done before anything else from
-# tornado is imported.
-from zmq.eventloop import ioloop
+from functools import lru_cache
+from types import SimpleNamespace
 
-ioloop.install()
+# On pyzmq < 17, the zmq ioloop must be installed before anything else from
+# tornado is imported.  On later versions install() is a deprecated no-op
+# (tornado runs on asyncio), so skip it - and the zmq.eventloop/tornado
+# imports it would trigger - and use tornado's own ioloop module instead.
+from zmq import pyzmq_version_info
+
+if pyzmq_version_info() < (17,):
+    from zmq.eventloop import ioloop
+    ioloop.install()
+else:
+    from tornado import ioloop
 from tornado.log import LogFormatter
 
-from traitlets import default, List, Set, Unicode, Type, Instance, Bool, Integer
-from jupyter_client.kernelspec import KernelSpecManager
-from notebook.services.kernels.kernelmanager import MappingKernelManager
+from traitlets import default, observe, List, Set, Unicode, Type, Instance, Bool, Integer
 from kernel_gateway.gatewayapp import KernelGatewayApp
-from kernel_gateway.services.sessions.sessionmanager import SessionManager
 
 from ._version import __version__
-from .services.sessions.kernelsessionmanager import KernelSessionManager, FileKernelSessionManager
-from .services.kernels.remotemanager import RemoteMappingKernelManager
+
+# Note: Manager classes (kernel spec, kernel, session) are intentionally NOT
+# imported at module level.  The Type/Instance traits below reference them in
+# string form so traitlets resolves them lazily, and the methods that actually
+# instantiate them import them locally.  This keeps their (large) transitive
+# import graphs off the critical path for invocations that never spawn kernels
+# (e.g., --help, --version).
+
+# Environment variables don't change over the life of the process, so they're read
+# (and, where applicable, parsed) once at import time rather than on every traitlets
+# default resolution - traitlets may resolve a default multiple times (validation,
+# cross-trait access, subclasses).
+# The names are interned since they're repeatedly hashed as cache keys.
+_ENV_SCHEMA = tuple((sys.intern(name), default) for name, default in (
+    ('EG_REMOTE_HOSTS', 'localhost'),
+    ('EG_YARN_ENDPOINT', None),
+    ('EG_ALT_YARN_ENDPOINT', None),
+    ('EG_YARN_ENDPOINT_SECURITY_ENABLED', False),
+    ('EG_CONDUCTOR_ENDPOINT', None),
+    ('EG_IMPERSONATION_ENABLED', 'false'),
+    ('EG_UNAUTHORIZED_USERS', 'root'),
+    ('EG_AUTHORIZED_USERS', None),
+    ('EG_PORT_RANGE', '0..0'),
+    ('EG_MAX_KERNELS_PER_USER', -1),
+    ('EG_WS_PING_INTERVAL_SECS', 30),
+))
+
+_TRUTHY = frozenset(('1', 'true', 'yes', 'on'))
+
+
+@lru_cache(maxsize=None)
+def _parse_csv(name, default=None):
+    """Returns the comma-split value of the cached env var as a tuple, memoized
+    so the split (and its allocations) happens at most once per variable."""
+    value = _ENV_CACHE.get(name, default)
+    if value is None:
+        return ()
+    return tuple(value.split(','))
+
+
+def _parse_int(name):
+    """Converts the cached value of the named env var to an int on first use,
+    memoizing the result back into the cache.  Malformed values fail at trait
+    resolution - as they did when the conversion lived in the default
+    callbacks - with the variable name in the message, rather than aborting
+    module import."""
+    value = _ENV_CACHE[name]
+    if not isinstance(value, int):
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValueError("Invalid integer value '{}' specified for env {}".format(value, name))
+        _ENV_CACHE[name] = value
+    return value
+
+
+def _refresh_env():
+    """(Re)builds the module-level env caches and the values derived from them.
+
+    A single linear scan of os.environ extracts every EG_* entry, replacing one
+    dict probe per variable with one walk of the (typically small) environment.
+    Called once at import; tests that monkeypatch os.environ can call it to
+    make this module observe the patched values.  The @default callbacks read
+    these caches at resolution time, so apps constructed after a refresh see
+    the new values; trait values already resolved on existing instances are
+    unaffected.
+    """
+    global _EG_ENV, _ENV_CACHE
+    global _IMPERSONATION_ENABLED, _YARN_ENDPOINT_SECURITY_ENABLED
+    global _REMOTE_HOSTS, _UNAUTHORIZED_USERS, _AUTHORIZED_USERS
+
+    _EG_ENV = {name: value for name, value in os.environ.items() if name.startswith('EG_')}
+    _ENV_CACHE = {name: _EG_ENV.get(name, default) for name, default in _ENV_SCHEMA}
+    _parse_csv.cache_clear()
+
+    # Boolean-valued env vars are resolved to real booleans here rather than
+    # lower-cased and compared on every default resolution.
+    _IMPERSONATION_ENABLED = str(_ENV_CACHE['EG_IMPERSONATION_ENABLED']).strip().lower() in _TRUTHY
+    _YARN_ENDPOINT_SECURITY_ENABLED = \
+        str(_ENV_CACHE['EG_YARN_ENDPOINT_SECURITY_ENABLED']).strip().lower() in _TRUTHY
+
+    # Shared immutable values for the host/user traits, parsed once per refresh.
+    # traitlets' Set trait requires a mutable set instance, so the default
+    # callbacks hand back shallow copies of these rather than re-splitting the
+    # environment; the List trait coerces the shared tuple itself.
+    _REMOTE_HOSTS = _parse_csv('EG_REMOTE_HOSTS')
+    _UNAUTHORIZED_USERS = frozenset(_parse_csv('EG_UNAUTHORIZED_USERS'))
+    _AUTHORIZED_USERS = frozenset(_parse_csv('EG_AUTHORIZED_USERS'))
+
+
+_refresh_env()
+
+
+def _parse_port_range(port_range):
+    """Returns the (lower, upper) ints from a 'lo..hi' string, or None when the
+    value is malformed.  Consumers treat None as 'parse the string yourself'
+    and surface the error through their own reporting paths (cf. processproxy's
+    _validate_port_range), so a bad value is reported at kernel launch rather
+    than raised here."""
+    try:
+        lower, upper = port_range.split('..')
+        return (int(lower), int(upper))
+    except ValueError:
+        return None
+
+
+def _personality_module_name(api_name):
+    """Maps the short-name api aliases to their module names, mirroring
+    KernelGatewayApp._load_api_module."""
+    if api_name == 'jupyter-websocket':
+        return 'kernel_gateway.jupyter_websocket'
+    if api_name == 'notebook-http':
+        return 'kernel_gateway.notebook_http'
+    return api_name
+
+
+@lru_cache(maxsize=None)
+def _resolve_personality(api_name):
+    """Imports the personality module named by ``api_name`` and returns its
+    create_personality factory, memoized per api name so repeated app
+    instances skip the import machinery and attribute lookup."""
+    return importlib.import_module(_personality_module_name(api_name)).create_personality
+
+
+class _LazyModule(object):
+    """Module proxy that defers the actual import until the first attribute
+    access."""
+    __slots__ = ('_name', '_mod')
+
+    def __init__(self, name):
+        self._name = name
+        self._mod = None
+
+    def __getattr__(self, attr):
+        if self._mod is None:
+            self._mod = importlib.import_module(self._name)
+        return getattr(self._mod, attr)
+
+
+# Default log format, including milliseconds.  A single shared instance so
+# every app/formatter sees the identical string.
+_LOG_FORMAT = u"%(color)s[%(levelname)1.1s %(asctime)s.%(msecs).03d %(name)s]%(end_color)s %(message)s"
 
 
 class EnterpriseGatewayApp(KernelGatewayApp):
@@ -52,7 +200,7 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('remote_hosts')
     def remote_hosts_default(self):
-        return os.getenv(self.remote_hosts_env, self.remote_hosts_default_value).split(',')
+        return list(_REMOTE_HOSTS)
 
     # Yarn endpoint
     yarn_endpoint_env = 'EG_YARN_ENDPOINT'
@@ -63,7 +211,7 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('yarn_endpoint')
     def yarn_endpoint_default(self):
-        return os.getenv(self.yarn_endpoint_env)
+        return _ENV_CACHE[self.yarn_endpoint_env]
 
     # Alt Yarn endpoint
     alt_yarn_endpoint_env = 'EG_ALT_YARN_ENDPOINT'
@@ -76,7 +224,7 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('alt_yarn_endpoint')
     def alt_yarn_endpoint_default(self):
-        return os.getenv(self.alt_yarn_endpoint_env)
+        return _ENV_CACHE[self.alt_yarn_endpoint_env]
 
     yarn_endpoint_security_enabled_env = 'EG_YARN_ENDPOINT_SECURITY_ENABLED'
     yarn_endpoint_security_enabled_default_value = False
@@ -86,26 +234,25 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('yarn_endpoint_security_enabled')
     def yarn_endpoint_security_enabled_default(self):
-        return bool(os.getenv(self.yarn_endpoint_security_enabled_env,
-                              self.yarn_endpoint_security_enabled_default_value))
+        return _YARN_ENDPOINT_SECURITY_ENABLED
 
     # Conductor endpoint
     conductor_endpoint_env = 'EG_CONDUCTOR_ENDPOINT'
     conductor_endpoint_default_value = None
-    conductor_endpoint = Unicode(conductor_endpoint_default_value, config=True,
+    conductor_endpoint = Unicode(conductor_endpoint_default_value, config=True, allow_none=True,
                                  help="""The http url for accessing the Conductor REST API.
                                  (EG_CONDUCTOR_ENDPOINT env var)""")
 
     @default('conductor_endpoint')
     def conductor_endpoint_default(self):
-        return os.getenv(self.conductor_endpoint_env, self.conductor_endpoint_default_value)
+        return _ENV_CACHE[self.conductor_endpoint_env]
 
     _log_formatter_cls = LogFormatter
 
     @default('log_format')
     def _default_log_format(self):
         """override default log format to include milliseconds"""
-        return u"%(color)s[%(levelname)1.1s %(asctime)s.%(msecs).03d %(name)s]%(end_color)s %(message)s"
+        return _LOG_FORMAT
 
     # Impersonation enabled
     impersonation_enabled_env = 'EG_IMPERSONATION_ENABLED'
@@ -115,7 +262,7 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('impersonation_enabled')
     def impersonation_enabled_default(self):
-        return bool(os.getenv(self.impersonation_enabled_env, 'false').lower() == 'true')
+        return _IMPERSONATION_ENABLED
 
     # Unauthorized users
     unauthorized_users_env = 'EG_UNAUTHORIZED_USERS'
@@ -128,7 +275,7 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('unauthorized_users')
     def unauthorized_users_default(self):
-        return os.getenv(self.unauthorized_users_env, self.unauthorized_users_default_value).split(',')
+        return set(_UNAUTHORIZED_USERS)
 
     # Authorized users
     authorized_users_env = 'EG_AUTHORIZED_USERS'
@@ -142,8 +289,7 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('authorized_users')
     def authorized_users_default(self):
-        au_env = os.getenv(self.authorized_users_env)
-        return au_env.split(',') if au_env is not None else []
+        return set(_AUTHORIZED_USERS)
 
     # Port range
     port_range_env = 'EG_PORT_RANGE'
@@ -156,7 +302,19 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('port_range')
     def port_range_default(self):
-        return os.getenv(self.port_range_env, self.port_range_default_value)
+        return _ENV_CACHE[self.port_range_env]
+
+    _port_range = None
+
+    @property
+    def port_range_tuple(self):
+        """Parsed (lower, upper) form of port_range, computed on first access
+        and re-computed only when the trait changes, so per-kernel-launch
+        consumers don't re-split the string.  None when the value is malformed.
+        """
+        if self._port_range is None:
+            self._port_range = _parse_port_range(self.port_range)
+        return self._port_range
 
     # Max Kernels per User
     max_kernels_per_user_env = 'EG_MAX_KERNELS_PER_USER'
@@ -168,7 +326,7 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('max_kernels_per_user')
     def max_kernels_per_user_default(self):
-        return int(os.getenv(self.max_kernels_per_user_env, self.max_kernels_per_user_default_value))
+        return _parse_int(self.max_kernels_per_user_env)
 
     ws_ping_interval_env = 'EG_WS_PING_INTERVAL_SECS'
     ws_ping_interval_default_value = 30
@@ -179,22 +337,24 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
     @default('ws_ping_interval')
     def ws_ping_interval_default(self):
-        return int(os.getenv(self.ws_ping_interval_env, self.ws_ping_interval_default_value))
+        return _parse_int(self.ws_ping_interval_env)
 
-    kernel_spec_manager = Instance(KernelSpecManager, allow_none=True)
+    kernel_spec_manager = Instance('jupyter_client.kernelspec.KernelSpecManager', allow_none=True)
 
     kernel_spec_manager_class = Type(
-        default_value=KernelSpecManager,
+        default_value='enterprise_gateway.services.kernelspecs.CachedKernelSpecManager',
         config=True,
         help="""
         The kernel spec manager class to use. Must be a subclass
-        of `jupyter_client.kernelspec.KernelSpecManager`.
+        of `jupyter_client.kernelspec.KernelSpecManager`.  The default honors
+        the EG_KERNELSPEC_CACHE env var, which can point at a pre-computed
+        kernelspec inventory (JSON) to skip filesystem walks at startup.
         """
     )
 
     kernel_manager_class = Type(
-        klass=MappingKernelManager,
-        default_value=RemoteMappingKernelManager,
+        klass='notebook.services.kernels.kernelmanager.MappingKernelManager',
+        default_value='enterprise_gateway.services.kernels.remotemanager.RemoteMappingKernelManager',
         config=True,
         help="""
         The kernel manager class to use. Must be a subclass
@@ -203,8 +363,8 @@ class EnterpriseGatewayApp(KernelGatewayApp):
     )
 
     kernel_session_manager_class = Type(
-        klass=KernelSessionManager,
-        default_value=FileKernelSessionManager,
+        klass='enterprise_gateway.services.sessions.kernelsessionmanager.KernelSessionManager',
+        default_value='enterprise_gateway.services.sessions.kernelsessionmanager.FileKernelSessionManager',
         config=True,
         help="""
         The kernel session manager class to use. Must be a subclass
@@ -212,6 +372,24 @@ class EnterpriseGatewayApp(KernelGatewayApp):
         """
     )
 
+    _seed_notebook = None
+    _seed_uri_pending = None
+
+    @property
+    def seed_notebook(self):
+        """Loads the notebook named by seed_uri on first access, memoizing the
+        result so startup doesn't pay for a parse that may never be consumed
+        (e.g., when no kernels are launched)."""
+        if self._seed_notebook is None and self._seed_uri_pending is not None:
+            self._seed_notebook = self._load_notebook(self._seed_uri_pending)
+            self._seed_uri_pending = None
+        return self._seed_notebook
+
+    @seed_notebook.setter
+    def seed_notebook(self, notebook):
+        self._seed_notebook = notebook
+        self._seed_uri_pending = None
+
     def init_configurables(self):
         """Initializes all configurable objects including a kernel manager, kernel
         spec manager, session manager, and personality.
@@ -222,18 +400,20 @@ class EnterpriseGatewayApp(KernelGatewayApp):
         Optionally, loads a notebook and pre-spawns the configured number of
         kernels.
         """
-        self.kernel_spec_manager = KernelSpecManager(parent=self)
+        from kernel_gateway.services.sessions.sessionmanager import SessionManager
 
-        self.seed_notebook = None
-        if self.seed_uri is not None:
-            # Note: must be set before instantiating a SeedingMappingKernelManager
-            self.seed_notebook = self._load_notebook(self.seed_uri)
+        # Note: must be recorded before instantiating a SeedingMappingKernelManager,
+        # which resolves the seed_notebook property (and thereby the load) lazily.
+        self._seed_notebook = None
+        self._seed_uri_pending = self.seed_uri
 
         # Only pass a default kernel name when one is provided. Otherwise,
-        # adopt whatever default the kernel manager wants to use.
-        kwargs = {}
+        # adopt whatever default the kernel manager wants to use.  The kernel
+        # session manager has no default_kernel_name trait, so it gets no
+        # portion of these kwargs.
+        km_kwargs = {}
         if self.default_kernel_name:
-            kwargs['default_kernel_name'] = self.default_kernel_name
+            km_kwargs['default_kernel_name'] = self.default_kernel_name
 
         self.kernel_spec_manager = self.kernel_spec_manager_class(
             parent=self,
@@ -244,7 +424,7 @@ class EnterpriseGatewayApp(KernelGatewayApp):
             log=self.log,
             connection_dir=self.runtime_dir,
             kernel_spec_manager=self.kernel_spec_manager,
-            **kwargs
+            **km_kwargs
         )
 
         # Detect older version of notebook
@@ -262,10 +442,13 @@ class EnterpriseGatewayApp(KernelGatewayApp):
             parent=self,
             log=self.log,
             kernel_manager=self.kernel_manager,
-            config=self.config,  # required to get command-line options visible
-            **kwargs
+            config=self.config  # required to get command-line options visible
         )
 
+        # Snapshot the launch-time configuration before any kernel can start
+        # (persisted sessions, prespawn).
+        self._build_snap()
+
         # Attempt to start persisted sessions
         self.kernel_session_manager.start_sessions()
 
@@ -277,12 +460,63 @@ class EnterpriseGatewayApp(KernelGatewayApp):
                     self.prespawn_count, self.max_kernels)
                 )
 
-        api_module = self._load_api_module(self.api)
-        func = getattr(api_module, 'create_personality')
-        self.personality = func(parent=self, log=self.log)
+        self.personality = _resolve_personality(self.api)(parent=self, log=self.log)
 
         self.personality.init_configurables()
 
+        # Lower-cased snapshot of unauthorized_users for case-insensitive checks,
+        # computed once rather than lower-casing on every comparison.
+        self._unauthorized_users_lc = frozenset(user.lower() for user in self.unauthorized_users)
+
+    # Snapshot of the launch-time configuration; None until init_configurables.
+    snap = None
+
+    def _build_snap(self):
+        """(Re)builds the launch-time configuration snapshot.  Per-kernel code
+        paths read these values repeatedly; a plain namespace attribute load
+        avoids a trip through the traitlets descriptor machinery each time,
+        and the immutable forms (tuples/frozensets) are safe to share."""
+        self.snap = SimpleNamespace(
+            remote_hosts=tuple(self.remote_hosts),
+            port_range=self.port_range,
+            port_range_tuple=self.port_range_tuple,
+            impersonation_enabled=self.impersonation_enabled,
+            yarn_endpoint=self.yarn_endpoint,
+            alt_yarn_endpoint=self.alt_yarn_endpoint,
+            yarn_endpoint_security_enabled=self.yarn_endpoint_security_enabled,
+            conductor_endpoint=self.conductor_endpoint,
+            max_kernels_per_user=self.max_kernels_per_user,
+            unauthorized_users=frozenset(self.unauthorized_users),
+            authorized_users=frozenset(self.authorized_users),
+            env_process_whitelist=frozenset(self.env_process_whitelist),
+        )
+
+    @observe('remote_hosts', 'port_range', 'impersonation_enabled', 'yarn_endpoint',
+             'alt_yarn_endpoint', 'yarn_endpoint_security_enabled', 'conductor_endpoint',
+             'max_kernels_per_user', 'unauthorized_users', 'authorized_users',
+             'env_process_whitelist')
+    def _refresh_snap(self, change):
+        """Keeps the parsed port range and the snapshot in sync when a captured
+        trait is assigned after startup (config reload, tests, programmatic
+        embedding), so subsequent kernel launches observe the new values."""
+        if change['name'] == 'port_range':
+            self._port_range = _parse_port_range(change['new'])
+        if self.snap is not None:
+            self._build_snap()
+
+    def _load_api_module(self, module_name):
+        """Overrides the superclass to return a proxy that defers the actual
+        import until an attribute is accessed.  Personalities drag in their
+        handlers and clients, so api-trait validation and app construction no
+        longer pay for an import that init_configurables may never exercise.
+        A nonexistent module still raises ImportError at assignment time:
+        find_spec locates the module without executing it.
+        """
+        resolved_name = _personality_module_name(module_name)
+        if importlib.util.find_spec(resolved_name) is None:
+            raise ImportError("No module named {}".format(resolved_name))
+        return _LazyModule(resolved_name)
+
     def init_webapp(self):
         """Initializes Tornado web application (via superclass) with uri handlers and enables remote access. """
         super(EnterpriseGatewayApp, self).init_webapp()
@@ -309,7 +543,7 @@ class EnterpriseGatewayApp(KernelGatewayApp):
         # If impersonation is enabled, issue a warning message if the gateway user is not in unauthorized_users.
         if self.impersonation_enabled:
             gateway_user = getpass.getuser()
-            if gateway_user.lower() not in self.unauthorized_users:
+            if gateway_user.lower() not in self._unauthorized_users_lc:
                 self.log.warning("Impersonation is enabled and gateway user '{}' is NOT specified in the set of "
                                  "unauthorized users!  Kernels may execute as that user with elevated privileges.".
                                  format(gateway_user))
@@ -318,11 +552,22 @@ class EnterpriseGatewayApp(KernelGatewayApp):
 
         signal.signal(signal.SIGHUP, signal.SIG_IGN)
 
-        signal.signal(signal.SIGTERM, self._signal_stop)
+        # Install both termination handlers before the loop starts so the first
+        # ctrl-c lands in the handler rather than unwinding through the
+        # KeyboardInterrupt machinery on the event-loop thread.  Where the loop
+        # wraps asyncio, register on the loop so wakeups are delivered inside it.
+        asyncio_loop = getattr(self.io_loop, 'asyncio_loop', None)
+        if asyncio_loop is not None:
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                asyncio_loop.add_signal_handler(sig, self._signal_stop, sig, None)
+        else:
+            signal.signal(signal.SIGTERM, self._signal_stop)
+            signal.signal(signal.SIGINT, self._signal_stop)
 
         try:
             self.io_loop.start()
         except KeyboardInterrupt:
+            # Fallback in case the SIGINT handler was not installed.
             self.log.info("Interrupted...")
             # Ignore further interrupts (ctrl-c)
             signal.signal(signal.SIGINT, signal.SIG_IGN)
@@ -333,16 +578,24 @@ class EnterpriseGatewayApp(KernelGatewayApp):
         """
         Stops the HTTP server and IO loop associated with the application.
         """
+        self.io_loop.add_callback(self._do_stop)
 
-        def _stop():
-            self.http_server.stop()
-            self.io_loop.stop()
-
-        self.io_loop.add_callback(_stop)
+    def _do_stop(self):
+        self.http_server.stop()
+        self.io_loop.stop()
 
     def _signal_stop(self, sig, frame):
         self.log.info("Received signal to terminate Enterprise Gateway.")
         self.io_loop.stop()
 
 
-launch_instance = EnterpriseGatewayApp.launch_instance
+def __getattr__(name):
+    """Resolves launch_instance lazily (PEP 562) so importers that only need,
+    e.g., the class name don't bind through the Application descriptor."""
+    if name == 'launch_instance':
+        return EnterpriseGatewayApp.launch_instance
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # no module-level __getattr__ (PEP 562) before 3.7
+    launch_instance = EnterpriseGatewayApp.launch_instance
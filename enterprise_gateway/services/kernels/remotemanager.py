@@ -233,7 +233,7 @@ class RemoteKernelManager(KernelGatewayIOLoopKernelManager):
         env = kwargs.get('env', {})
         self.user_overrides.update({key: value for key, value in env.items()
                                    if key.startswith('KERNEL_') or
-                                    key in self.parent.parent.env_process_whitelist or
+                                    key in self.parent.parent.snap.env_process_whitelist or
                                     key in self.parent.parent.personality.env_whitelist})
 
     def format_kernel_cmd(self, extra_arguments=None):
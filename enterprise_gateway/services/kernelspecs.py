@@ -0,0 +1,44 @@
+# Copyright (c) Jupyter Development Team.
+# Distributed under the terms of the Modified BSD License.
+"""Kernel spec manager that can serve a pre-computed kernelspec inventory."""
+
+import json
+import os
+
+from jupyter_client.kernelspec import KernelSpecManager
+
+
+class CachedKernelSpecManager(KernelSpecManager):
+    """Kernel spec manager that can load its kernelspec inventory from a
+    pre-computed JSON file instead of walking the kernel directories.
+
+    When the EG_KERNELSPEC_CACHE env var points at a JSON file mapping kernel
+    names to their resource directories (the same shape `find_kernel_specs`
+    returns), the file is loaded once at construction and served on every
+    `find_kernel_specs` call, skipping the per-directory listing otherwise
+    performed at startup.  Intended for deployments (e.g., containers) whose
+    kernelspec inventory is fixed at image-build time.  When the env var is
+    not set, behavior is identical to `KernelSpecManager`.
+    """
+
+    def __init__(self, **kwargs):
+        super(CachedKernelSpecManager, self).__init__(**kwargs)
+        self._kernel_spec_cache = None
+        cache_file = os.environ.get('EG_KERNELSPEC_CACHE')
+        if cache_file:
+            try:
+                with open(cache_file) as f:
+                    self._kernel_spec_cache = json.load(f)
+            except (OSError, ValueError) as e:
+                error_message = "Could not load kernelspec inventory from '{}' (EG_KERNELSPEC_CACHE): {}".\
+                    format(cache_file, e)
+                self.log.error(error_message)
+                raise RuntimeError(error_message)
+
+    def find_kernel_specs(self):
+        """Returns the cached inventory when one was loaded, otherwise defers
+        to the filesystem walk.  Callers should treat the result as read-only.
+        """
+        if self._kernel_spec_cache is not None:
+            return self._kernel_spec_cache
+        return super(CachedKernelSpecManager, self).find_kernel_specs()
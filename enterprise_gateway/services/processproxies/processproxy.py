@@ -128,7 +128,7 @@ class BaseProcessProxyABC(with_metaclass(abc.ABCMeta, object)):
 
         # Handle authorization sets...
         # Take union of unauthorized users...
-        self.unauthorized_users = self.kernel_manager.parent.parent.unauthorized_users
+        self.unauthorized_users = self.kernel_manager.parent.parent.snap.unauthorized_users
         if proxy_config.get('unauthorized_users'):
             self.unauthorized_users = self.unauthorized_users.union(proxy_config.get('unauthorized_users').split(','))
 
@@ -136,7 +136,7 @@ class BaseProcessProxyABC(with_metaclass(abc.ABCMeta, object)):
         if proxy_config.get('authorized_users'):
             self.authorized_users = set(proxy_config.get('authorized_users').split(','))
         else:
-            self.authorized_users = self.kernel_manager.parent.parent.authorized_users
+            self.authorized_users = self.kernel_manager.parent.parent.snap.authorized_users
 
         # Represents the local process (from popen) if applicable.  Note that we could have local_proc = None even when
         # the subclass is a LocalProcessProxy (or YarnProcessProxy).  This will happen if EG is restarted and the
@@ -426,7 +426,7 @@ class BaseProcessProxyABC(with_metaclass(abc.ABCMeta, object)):
 
         # Although it may already be set in the env, just override in case it was only set via command line or config
         # Convert to string since execve() (called by Popen in base classes) wants string values.
-        env_dict['EG_IMPERSONATION_ENABLED'] = str(self.kernel_manager.parent.parent.impersonation_enabled)
+        env_dict['EG_IMPERSONATION_ENABLED'] = str(self.kernel_manager.parent.parent.snap.impersonation_enabled)
 
         # Ensure KERNEL_USERNAME is set
         kernel_username = KernelSessionManager.get_kernel_username(**kwargs)
@@ -454,7 +454,7 @@ class BaseProcessProxyABC(with_metaclass(abc.ABCMeta, object)):
 
         # if kernels-per-user is configured, ensure that this next kernel is still within the limit.  If this
         # is due to a restart, skip enforcement since we're re-using that id.
-        max_kernels_per_user = self.kernel_manager.parent.parent.max_kernels_per_user
+        max_kernels_per_user = self.kernel_manager.parent.parent.snap.max_kernels_per_user
         if max_kernels_per_user >= 0 and not self.kernel_manager.restarting:
             env_dict = kwargs.get('env')
             username = env_dict['KERNEL_USERNAME']
@@ -488,15 +488,21 @@ class BaseProcessProxyABC(with_metaclass(abc.ABCMeta, object)):
     def _validate_port_range(self, proxy_config):
         """Validates the port range configuration option to ensure appropriate values."""
         # Let port_range override global value - if set on kernelspec...
-        port_range = self.kernel_manager.parent.parent.port_range
+        snap = self.kernel_manager.parent.parent.snap
+        port_range = snap.port_range
+        port_range_tuple = snap.port_range_tuple  # pre-parsed; None if malformed
         if proxy_config.get('port_range'):
             port_range = proxy_config.get('port_range')
+            port_range_tuple = None
 
         try:
-            port_ranges = port_range.split("..")
+            if port_range_tuple is not None:
+                self.lower_port, self.upper_port = port_range_tuple
+            else:
+                port_ranges = port_range.split("..")
 
-            self.lower_port = int(port_ranges[0])
-            self.upper_port = int(port_ranges[1])
+                self.lower_port = int(port_ranges[0])
+                self.upper_port = int(port_ranges[1])
 
             port_range_size = self.upper_port - self.lower_port
             if port_range_size != 0:
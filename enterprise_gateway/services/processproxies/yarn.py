@@ -40,14 +40,14 @@ class YarnClusterProcessProxy(RemoteProcessProxy):
         self.rm_addr = None
         self.yarn_endpoint \
             = proxy_config.get('yarn_endpoint',
-                               kernel_manager.parent.parent.yarn_endpoint)
+                               kernel_manager.parent.parent.snap.yarn_endpoint)
         self.alt_yarn_endpoint \
             = proxy_config.get('alt_yarn_endpoint',
-                               kernel_manager.parent.parent.alt_yarn_endpoint)
+                               kernel_manager.parent.parent.snap.alt_yarn_endpoint)
 
         self.yarn_endpoint_security_enabled \
             = proxy_config.get('yarn_endpoint_security_enabled',
-                               kernel_manager.parent.parent.yarn_endpoint_security_enabled)
+                               kernel_manager.parent.parent.snap.yarn_endpoint_security_enabled)
 
         yarn_master = alt_yarn_master = None
         yarn_port = alt_yarn_port = None
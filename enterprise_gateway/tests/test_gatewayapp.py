@@ -2,10 +2,14 @@
 # Distributed under the terms of the Modified BSD License.
 """Tests for basic gateway app behavior."""
 
+import json
 import logging
+import tempfile
 import unittest
 import os
 from enterprise_gateway.enterprisegatewayapp import EnterpriseGatewayApp, ioloop
+from enterprise_gateway.services.kernelspecs import CachedKernelSpecManager
+from jupyter_client.kernelspec import KernelSpecManager
 from kernel_gateway.notebook_http.swagger.handlers import SwaggerSpecHandler
 from tornado.testing import AsyncHTTPTestCase, ExpectLog
 
@@ -68,6 +72,45 @@ class TestGatewayAppConfig(unittest.TestCase):
         self.assertEqual(app.client_ca, '/test/fake_ca.crt')
 
 
+class TestCachedKernelSpecManager(unittest.TestCase):
+    """Tests kernelspec inventory caching controlled by EG_KERNELSPEC_CACHE."""
+    def setUp(self):
+        """Saves a copy of the environment."""
+        self.environ = dict(os.environ)
+
+    def tearDown(self):
+        """Resets the environment."""
+        os.environ = self.environ
+
+    def test_cached_inventory_is_served(self):
+        """A JSON inventory named by EG_KERNELSPEC_CACHE should be returned as-is."""
+        inventory = {'fake_kernel': '/fake/resource/dir'}
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as cache_file:
+            json.dump(inventory, cache_file)
+        self.addCleanup(os.remove, cache_file.name)
+        os.environ['EG_KERNELSPEC_CACHE'] = cache_file.name
+
+        manager = CachedKernelSpecManager()
+        self.assertEqual(manager.find_kernel_specs(), inventory)
+
+    def test_no_cache_defers_to_superclass(self):
+        """Without EG_KERNELSPEC_CACHE, discovery should walk the filesystem."""
+        os.environ.pop('EG_KERNELSPEC_CACHE', None)
+
+        manager = CachedKernelSpecManager()
+        self.assertIsNone(manager._kernel_spec_cache)
+        self.assertEqual(manager.find_kernel_specs(), KernelSpecManager.find_kernel_specs(manager))
+
+    def test_bad_cache_file_is_reported(self):
+        """A stale or unreadable cache file should name the env var rather than
+        raise a raw traceback."""
+        os.environ['EG_KERNELSPEC_CACHE'] = '/does/not/exist.json'
+
+        with self.assertRaises(RuntimeError) as context:
+            CachedKernelSpecManager()
+        self.assertIn('EG_KERNELSPEC_CACHE', str(context.exception))
+
+
 class TestGatewayAppBase(AsyncHTTPTestCase, ExpectLog):
     """Base class for integration style tests using HTTP/Websockets against an
     instance of the gateway app.